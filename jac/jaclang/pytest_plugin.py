@@ -130,6 +130,32 @@ def _ensure_jac_runtime():
         pytest.skip(f"Jac runtime unavailable: {exc}")
 
 
+_shared_pool: ThreadPoolExecutor | None = None
+
+
+def _shared_jac_pool() -> ThreadPoolExecutor:
+    """Return the session-wide executor backing ``JacRuntime.pool``.
+
+    Tests only need the runtime to point at a live pool, not a private
+    one: constructing a ThreadPoolExecutor per test (and leaking the old
+    one, since nothing shut it down) churned OS threads for no isolation
+    benefit.  The pool is created on first use and shut down once in
+    ``pytest_unconfigure``.
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = ThreadPoolExecutor()
+    return _shared_pool
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Shut down the shared executor at the end of the session."""
+    global _shared_pool
+    if _shared_pool is not None:
+        _shared_pool.shutdown(wait=False)
+        _shared_pool = None
+
+
 def _fresh_jac_state(*, clear_modules: bool = True):
     """Reset Jac state so each test gets a clean environment.
 
@@ -167,7 +193,7 @@ def _fresh_jac_state(*, clear_modules: bool = True):
     JacRuntime.set_base_path(fresh_base)
     JacRuntime.set_full_target_path(None)
     JacRuntime.program = JacProgram()
-    JacRuntime.pool = ThreadPoolExecutor()
+    JacRuntime.pool = _shared_jac_pool()
     JacRuntime.exec_ctx = JacRuntimeInterface.create_j_context(
         user_root=None, base_path_dir=fresh_base, full_target_path=None
     )
@@ -32,6 +32,9 @@ def disable_rich_console_formatting(monkeypatch: pytest.MonkeyPatch) -> None:
 # Store unregistered plugins for session-level management
 _external_plugins: list[tuple[str, Any]] = []
 
+# Core runtime plugins that must stay registered during jac tests.
+_CORE_PLUGIN_NAMES = frozenset({"JacRuntimeImpl", "JacRuntimeInterfaceImpl"})
+
 
 def pytest_configure(config: pytest.Config) -> None:
     """Disable external plugins at the start of the jac test session.
@@ -47,11 +50,10 @@ def pytest_configure(config: pytest.Config) -> None:
     from jaclang.jac0core.runtime import JacRuntimeImpl, plugin_manager
 
     global _external_plugins
-    for name, plugin in list(plugin_manager.list_name_plugin()):
-        if plugin is JacRuntimeImpl or name in (
-            "JacRuntimeImpl",
-            "JacRuntimeInterfaceImpl",
-        ):
+    # list_name_plugin() already returns a fresh list, so unregistering
+    # while iterating it is safe without an extra copy.
+    for name, plugin in plugin_manager.list_name_plugin():
+        if plugin is JacRuntimeImpl or name in _CORE_PLUGIN_NAMES:
             continue
         _external_plugins.append((name, plugin))
         plugin_manager.unregister(plugin=plugin, name=name)